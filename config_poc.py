@@ -4,12 +4,48 @@ Python Proof-of-Concept: Configuration Management
 Demonstrates how the current Bash config validation would look in Python
 """
 
+import os
 import re
-import ipaddress
+import stat
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, validator, ValidationError
+from pydantic import BaseModel, field_validator, model_validator, TypeAdapter, ValidationError
+
+# Validation patterns compiled once at import - avoids the per-call pattern
+# cache lookup inside re.match()
+_DRIVE_RE = re.compile(r'/dev/nvme\d+n\d+')
+_LOCALE_RE = re.compile(r'[a-z]{2}_[A-Z]{2}\.UTF-8')
+_TZ_RE = re.compile(r'[A-Z][a-z_]+/[A-Z][a-z_]+')
+_USERNAME_RE = re.compile(r'[a-z][a-z0-9_-]*')
+_HOSTNAME_RE = re.compile(r'[a-zA-Z0-9-]+')
+_IPV4_RE = re.compile(r'(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})')
+
+# One-pass key=value tokenizer for shell-style configs. Comment lines never
+# match because '#' falls outside the key character class, so the whole file
+# is parsed in a single C-level scan with no per-line Python dispatch. The
+# pattern is bytes-based so the buffer never needs a full decode; only the
+# extracted groups do.
+_KV_RE = re.compile(rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*["\']?([^"\'\n]*?)["\']?[ \t]*$', re.M)
+
+@lru_cache(maxsize=64)
+def _drive_exists(path: str) -> bool:
+    """Check that the path names a block device, caching the stat result
+    so repeated validations of the same drive skip the syscall."""
+    try:
+        return stat.S_ISBLK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+def _is_ipv4(v: str) -> bool:
+    """Check dotted-quad IPv4 format without the exception-driven
+    ipaddress path - a regex match plus octet range test keeps the common
+    valid case off the Python exception machinery entirely. Leading-zero
+    octets are rejected to match ipaddress.IPv4Address."""
+    m = _IPV4_RE.fullmatch(v)
+    return bool(m) and all(int(g) <= 255 and (len(g) == 1 or g[0] != '0')
+                           for g in m.groups())
 
 class NetworkConfig(BaseModel):
     """Network configuration with built-in validation"""
@@ -22,40 +58,39 @@ class NetworkConfig(BaseModel):
     domain_search: Optional[str] = None
     dns_suffix: Optional[str] = None
     
-    @validator('network_type')
+    @field_validator('network_type')
+    @classmethod
     def validate_network_type(cls, v):
         if v not in ['dhcp', 'static', 'manual']:
             raise ValueError('network_type must be dhcp, static, or manual')
         return v
-    
-    @validator('ip_address')
-    def validate_ip(cls, v, values):
-        if values.get('network_type') == 'static' and not v:
-            raise ValueError('IP address required for static configuration')
-        if v:
-            try:
-                ipaddress.IPv4Address(v)
-            except ipaddress.AddressValueError:
-                raise ValueError('Invalid IP address format')
-        return v
-    
-    @validator('gateway')
-    def validate_gateway(cls, v, values):
-        if values.get('network_type') == 'static' and not v:
-            raise ValueError('Gateway required for static configuration')
-        if v:
-            try:
-                ipaddress.IPv4Address(v)
-            except ipaddress.AddressValueError:
-                raise ValueError('Invalid gateway IP address')
+
+    @field_validator('ip_address')
+    @classmethod
+    def validate_ip(cls, v):
+        if v and not _is_ipv4(v):
+            raise ValueError('Invalid IP address format')
         return v
-    
-    @validator('interface')
-    def validate_interface(cls, v, values):
-        if values.get('network_type') == 'static' and not v:
-            raise ValueError('Interface required for static configuration')
+
+    @field_validator('gateway')
+    @classmethod
+    def validate_gateway(cls, v):
+        if v and not _is_ipv4(v):
+            raise ValueError('Invalid gateway IP address')
         return v
 
+    @model_validator(mode='after')
+    def validate_static_requirements(self):
+        # Cross-field checks done in one traversal after field validation
+        if self.network_type == 'static':
+            if not self.ip_address:
+                raise ValueError('IP address required for static configuration')
+            if not self.gateway:
+                raise ValueError('Gateway required for static configuration')
+            if not self.interface:
+                raise ValueError('Interface required for static configuration')
+        return self
+
 class SystemConfig(BaseModel):
     """Complete system configuration with validation"""
     target_drive: str
@@ -67,42 +102,57 @@ class SystemConfig(BaseModel):
     filesystem: str = "ext4"
     network: NetworkConfig
     
-    @validator('target_drive')
+    @field_validator('target_drive')
+    @classmethod
     def validate_drive(cls, v):
-        if not re.match(r'/dev/nvme\d+n\d+$', v):
+        if not _DRIVE_RE.fullmatch(v):
             raise ValueError('Invalid NVMe drive path format')
-        if not Path(v).exists():
-            raise ValueError(f'Drive {v} does not exist')
+        if not _drive_exists(v):
+            raise ValueError(f'Drive {v} does not exist or is not a block device')
         return v
     
-    @validator('locale')
+    @field_validator('locale')
+    @classmethod
     def validate_locale(cls, v):
-        if not re.match(r'[a-z]{2}_[A-Z]{2}\.UTF-8$', v):
+        if not _LOCALE_RE.fullmatch(v):
             raise ValueError('Locale must be in format: en_US.UTF-8')
         return v
     
-    @validator('timezone')
+    @field_validator('timezone')
+    @classmethod
     def validate_timezone(cls, v):
-        if not re.match(r'[A-Z][a-z_]+/[A-Z][a-z_]+$', v):
+        if not _TZ_RE.fullmatch(v):
             raise ValueError('Timezone must be in format: America/New_York')
         return v
     
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
-        if not re.match(r'^[a-z][a-z0-9_-]*$', v):
-            raise ValueError('Username must start with letter, contain only lowercase letters, numbers, underscore, dash')
+        # Length first: a single comparison rejects oversized input before
+        # the regex ever runs
         if len(v) > 32:
             raise ValueError('Username too long (max 32 characters)')
+        if not _USERNAME_RE.fullmatch(v):
+            raise ValueError('Username must start with letter, contain only lowercase letters, numbers, underscore, dash')
         return v
     
-    @validator('hostname')
+    @field_validator('hostname')
+    @classmethod
     def validate_hostname(cls, v):
-        if not re.match(r'^[a-zA-Z0-9-]+$', v):
-            raise ValueError('Hostname can only contain letters, numbers, and hyphens')
         if len(v) > 63:
             raise ValueError('Hostname too long (max 63 characters)')
+        if not _HOSTNAME_RE.fullmatch(v):
+            raise ValueError('Hostname can only contain letters, numbers, and hyphens')
         return v
 
+# Adapters built once at import so repeated load_config calls reuse the same
+# pydantic-core validator instead of re-resolving the model schema. On-disk
+# schema caching was considered and rejected: unpickling a TypeAdapter
+# rebuilds the schema anyway, and loading a user-writable cache file in a
+# tool that runs as root would be a code-execution vector.
+_SYSTEM_ADAPTER = TypeAdapter(SystemConfig)
+_NET_ADAPTER = TypeAdapter(NetworkConfig)
+
 class ConfigManager:
     """Configuration management with validation"""
     
@@ -117,11 +167,15 @@ class ConfigManager:
             return None
         
         try:
-            # Parse the shell-style config (simplified for demo)
-            config_data = self._parse_shell_config()
-            
-            # Validate with Pydantic
-            self.config = SystemConfig(**config_data)
+            if self.config_file.suffix == '.json':
+                # JSON variant: parse and validate in one fused pydantic-core pass
+                self.config = self._load_json()
+            else:
+                # Parse the shell-style config (simplified for demo)
+                config_data = self._parse_shell_config()
+
+                # Validate with Pydantic in a single pydantic-core pass
+                self.config = _SYSTEM_ADAPTER.validate_python(config_data)
             print("✅ Configuration loaded and validated successfully")
             return self.config
             
@@ -136,42 +190,47 @@ class ConfigManager:
             print(f"❌ Error loading configuration: {e}")
             return None
     
+    def _load_json(self) -> SystemConfig:
+        """Load a JSON config variant directly through pydantic-core.
+
+        model_validate_json parses and validates in one pass, so no
+        intermediate dict or json.loads round-trip is built; passing the
+        raw bytes also leaves the UTF-8 decode to pydantic-core.
+        """
+        return SystemConfig.model_validate_json(self.config_file.read_bytes())
+
     def _parse_shell_config(self) -> Dict[str, Any]:
         """Parse shell-style configuration file"""
-        config_data = {}
-        
         # This is a simplified parser - in reality you'd use something more robust
-        content = self.config_file.read_text()
-        
-        # Extract basic variables
-        for line in content.splitlines():
-            line = line.strip()
-            if '=' in line and not line.startswith('#'):
-                key, value = line.split('=', 1)
-                # Remove quotes
-                value = value.strip('"\'')
-                config_data[key] = value
-        
-        # Structure the data for Pydantic
+        content = self.config_file.read_bytes()
+
+        # Extract basic variables in one pass over the raw buffer,
+        # decoding only the matched key/value slices
+        config_data = {m.group(1).decode('ascii'): m.group(2).decode('utf-8')
+                       for m in _KV_RE.finditer(content)}
+
+        # Structure the data for Pydantic; the bound .get saves an
+        # attribute lookup on each of the fifteen field reads
+        g = config_data.get
         network_data = {
-            'network_type': config_data.get('network_config', 'dhcp'),
-            'interface': config_data.get('static_iface'),
-            'ip_address': config_data.get('static_ip'),
-            'netmask': config_data.get('static_netmask'),
-            'gateway': config_data.get('static_gateway'),
-            'dns_servers': config_data.get('static_dns'),
-            'domain_search': config_data.get('static_domain_search'),
-            'dns_suffix': config_data.get('static_dns_suffix'),
+            'network_type': g('network_config', 'dhcp'),
+            'interface': g('static_iface'),
+            'ip_address': g('static_ip'),
+            'netmask': g('static_netmask'),
+            'gateway': g('static_gateway'),
+            'dns_servers': g('static_dns'),
+            'domain_search': g('static_domain_search'),
+            'dns_suffix': g('static_dns_suffix'),
         }
         
         structured_config = {
-            'target_drive': config_data.get('target_drive', ''),
-            'locale': config_data.get('locale', 'en_US.UTF-8'),
-            'timezone': config_data.get('timezone', 'America/New_York'),
-            'username': config_data.get('username', ''),
-            'hostname': config_data.get('hostname', ''),
-            'swap_size': config_data.get('swap_size', 'auto'),
-            'filesystem': config_data.get('filesystem', 'ext4'),
+            'target_drive': g('target_drive', ''),
+            'locale': g('locale', 'en_US.UTF-8'),
+            'timezone': g('timezone', 'America/New_York'),
+            'username': g('username', ''),
+            'hostname': g('hostname', ''),
+            'swap_size': g('swap_size', 'auto'),
+            'filesystem': g('filesystem', 'ext4'),
             'network': network_data
         }
         
@@ -179,7 +238,9 @@ class ConfigManager:
     
     def save_config(self, config: SystemConfig) -> None:
         """Save configuration to file"""
-        content = f'''# KDE Neon Installation Configuration
+        # Collect sections in a list and join once - repeated += on str
+        # reallocates the whole buffer for every optional section
+        parts = [f'''# KDE Neon Installation Configuration
 target_drive="{config.target_drive}"
 locale="{config.locale}"
 timezone="{config.timezone}"
@@ -190,23 +251,23 @@ filesystem="{config.filesystem}"
 
 # Network Configuration
 network_config="{config.network.network_type}"
-'''
-        
+''']
+
         if config.network.network_type == 'static':
-            content += f'''static_iface="{config.network.interface}"
+            parts.append(f'''static_iface="{config.network.interface}"
 static_ip="{config.network.ip_address}"
 static_netmask="{config.network.netmask}"
 static_gateway="{config.network.gateway}"
 static_dns="{config.network.dns_servers}"
-'''
-        
+''')
+
         if config.network.domain_search:
-            content += f'static_domain_search="{config.network.domain_search}"\n'
-        
+            parts.append(f'static_domain_search="{config.network.domain_search}"\n')
+
         if config.network.dns_suffix:
-            content += f'static_dns_suffix="{config.network.dns_suffix}"\n'
-        
-        self.config_file.write_text(content)
+            parts.append(f'static_dns_suffix="{config.network.dns_suffix}"\n')
+
+        self.config_file.write_text(''.join(parts))
         print(f"✅ Configuration saved to {self.config_file}")
 
 def demo_validation():
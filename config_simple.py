@@ -5,14 +5,89 @@ Demonstrates validation without external dependencies
 """
 
 import re
-import ipaddress
-from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
-@dataclass
-class ValidationError:
-    field: str
-    message: str
+# Validation patterns compiled once at import instead of per call
+_DRIVE_RE = re.compile(r'/dev/nvme\d+n\d+')
+_USERNAME_RE = re.compile(r'[a-z][a-z0-9_-]*')
+_LOCALE_RE = re.compile(r'[a-z]{2}_[A-Z]{2}\.UTF-8')
+_IPV4_RE = re.compile(r'(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})')
+
+# Batch validation revisits the same values (default locales, reused
+# hostnames) many times, so the pure regex predicates are memoized; the
+# caches are bounded and thread-safe.
+@lru_cache(maxsize=4096)
+def _ok_drive(drive: str) -> bool:
+    return _DRIVE_RE.fullmatch(drive) is not None
+
+@lru_cache(maxsize=4096)
+def _ok_username(username: str) -> bool:
+    return _USERNAME_RE.fullmatch(username) is not None
+
+@lru_cache(maxsize=4096)
+def _ok_locale(locale: str) -> bool:
+    return _LOCALE_RE.fullmatch(locale) is not None
+
+# Optional multi-pattern engine for batch validation: when the hyperscan
+# bindings are installed, the field formats compile together into a single
+# DFA that scans each value linearly with no backtracking. The standard
+# library re path above remains the default and the fallback.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Patterns here are self-contained accept tests (the username one encodes
+# the 32-char limit), so a prefilter hit means the field is fully valid
+_HS_PATTERNS = (
+    ('target_drive', rb'^/dev/nvme\d+n\d+$'),
+    ('username', rb'^[a-z][a-z0-9_-]{0,31}$'),
+    ('locale', rb'^[a-z]{2}_[A-Z]{2}\.UTF-8$'),
+)
+# None = not yet attempted, False = build failed (don't retry)
+_hs_db = None
+
+def _hs_database():
+    """Build the combined hyperscan database once; None when unavailable"""
+    global _hs_db
+    if _hs_db is None and hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=[pattern for _, pattern in _HS_PATTERNS],
+                       ids=list(range(len(_HS_PATTERNS))),
+                       flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_HS_PATTERNS))
+            _hs_db = db
+        except Exception:
+            # The accelerator must never break the stdlib re path
+            _hs_db = False
+    return _hs_db or None
+
+def _hs_prefilter(config_data: Dict[str, str]) -> Dict[str, bool]:
+    """Batch-scan the format-checked fields against the combined DFA.
+
+    Returns {field: True} for fields whose values matched their pattern;
+    empty when hyperscan is not installed, so callers fall back to re.
+    """
+    db = _hs_database()
+    if db is None:
+        return {}
+    passed = {}
+    for pattern_id, (field_name, _) in enumerate(_HS_PATTERNS):
+        value = config_data.get(field_name)
+        if not value:
+            continue
+        hits = set()
+        db.scan(value.encode(),
+                match_event_handler=lambda i, s, e, f, ctx: hits.add(i))
+        if pattern_id in hits:
+            passed[field_name] = True
+    return passed
+
+# Errors are plain (field, message) tuples - construction is a single
+# PyTuple_New versus dataclass __init__ dispatch, which matters when a
+# batch of configs fails many checks at once
+ValidationError = tuple
 
 class ConfigValidator:
     """Configuration validation using standard library only"""
@@ -20,34 +95,37 @@ class ConfigValidator:
     @staticmethod
     def validate_drive_path(drive: str) -> Optional[ValidationError]:
         """Validate NVMe drive path"""
-        if not re.match(r'/dev/nvme\d+n\d+$', drive):
-            return ValidationError('target_drive', 'Invalid NVMe drive path format')
+        if not _ok_drive(drive):
+            return ('target_drive', 'Invalid NVMe drive path format')
         return None
     
     @staticmethod
-    def validate_ip_address(ip: str) -> Optional[ValidationError]:
-        """Validate IP address format"""
-        try:
-            ipaddress.IPv4Address(ip)
-            return None
-        except ipaddress.AddressValueError:
-            return ValidationError('ip_address', 'Invalid IP address format')
+    def _is_ipv4(ip: str) -> bool:
+        """Check IPv4 format without the exception-driven ipaddress path.
+
+        Leading-zero octets are rejected to match ipaddress.IPv4Address.
+        """
+        m = _IPV4_RE.fullmatch(ip)
+        return bool(m) and all(int(g) <= 255 and (len(g) == 1 or g[0] != '0')
+                               for g in m.groups())
     
     @staticmethod
     def validate_username(username: str) -> Optional[ValidationError]:
         """Validate Linux username"""
-        if not re.match(r'^[a-z][a-z0-9_-]*$', username):
-            return ValidationError('username', 
-                'Username must start with letter, contain only lowercase letters, numbers, underscore, dash')
+        # Length first: a single comparison rejects oversized input before
+        # the regex ever runs
         if len(username) > 32:
-            return ValidationError('username', 'Username too long (max 32 characters)')
+            return ('username', 'Username too long (max 32 characters)')
+        if not _ok_username(username):
+            return ('username', 
+                'Username must start with letter, contain only lowercase letters, numbers, underscore, dash')
         return None
     
     @staticmethod
     def validate_locale(locale: str) -> Optional[ValidationError]:
         """Validate locale format"""
-        if not re.match(r'[a-z]{2}_[A-Z]{2}\.UTF-8$', locale):
-            return ValidationError('locale', 'Locale must be in format: en_US.UTF-8')
+        if not _ok_locale(locale):
+            return ('locale', 'Locale must be in format: en_US.UTF-8')
         return None
     
     @staticmethod
@@ -57,25 +135,20 @@ class ConfigValidator:
         network_type = config.get('network_config', '')
         
         if network_type not in ['dhcp', 'static', 'manual']:
-            errors.append(ValidationError('network_config', 'Must be dhcp, static, or manual'))
+            errors.append(('network_config', 'Must be dhcp, static, or manual'))
         
         if network_type == 'static':
             required_fields = ['static_ip', 'static_gateway', 'static_iface']
             for field in required_fields:
                 if not config.get(field):
-                    errors.append(ValidationError(field, f'{field} required for static configuration'))
+                    errors.append((field, f'{field} required for static configuration'))
             
-            # Validate IP addresses
-            if config.get('static_ip'):
-                ip_error = ConfigValidator.validate_ip_address(config['static_ip'])
-                if ip_error:
-                    errors.append(ip_error)
+            # Validate IP addresses - errors are only constructed on failure
+            if config.get('static_ip') and not ConfigValidator._is_ipv4(config['static_ip']):
+                errors.append(('static_ip', 'Invalid IP address format'))
             
-            if config.get('static_gateway'):
-                gw_error = ConfigValidator.validate_ip_address(config['static_gateway'])
-                if gw_error:
-                    gw_error.field = 'static_gateway'
-                    errors.append(gw_error)
+            if config.get('static_gateway') and not ConfigValidator._is_ipv4(config['static_gateway']):
+                errors.append(('static_gateway', 'Invalid IP address format'))
         
         return errors
 
@@ -87,20 +160,23 @@ def validate_config_file(config_data: Dict[str, str]) -> List[ValidationError]:
     required = ['target_drive', 'username', 'hostname']
     for field in required:
         if not config_data.get(field):
-            errors.append(ValidationError(field, f'{field} is required'))
+            errors.append((field, f'{field} is required'))
     
-    # Validate individual fields
-    if config_data.get('target_drive'):
+    # Validate individual fields; values accepted by the combined-DFA
+    # prefilter skip the per-field validators entirely
+    prefiltered = _hs_prefilter(config_data)
+
+    if config_data.get('target_drive') and not prefiltered.get('target_drive'):
         drive_error = ConfigValidator.validate_drive_path(config_data['target_drive'])
         if drive_error:
             errors.append(drive_error)
     
-    if config_data.get('username'):
+    if config_data.get('username') and not prefiltered.get('username'):
         user_error = ConfigValidator.validate_username(config_data['username'])
         if user_error:
             errors.append(user_error)
     
-    if config_data.get('locale'):
+    if config_data.get('locale') and not prefiltered.get('locale'):
         locale_error = ConfigValidator.validate_locale(config_data['locale'])
         if locale_error:
             errors.append(locale_error)
@@ -162,8 +238,8 @@ def demo_bash_vs_python():
         
         if errors:
             print("❌ Validation errors found:")
-            for error in errors:
-                print(f"  {error.field}: {error.message}")
+            for field, message in errors:
+                print(f"  {field}: {message}")
         else:
             print("✅ Configuration is valid")
     
@@ -4,18 +4,25 @@ Python Proof-of-Concept: Hardware Detection Module
 Demonstrates how the current Bash hardware detection would look in Python
 """
 
+import json
+import os
 import re
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Patterns compiled once at import - efibootmgr output is parsed line-by-line,
+# so the per-call pattern cache lookup adds up
+_NVME_NAME_RE = re.compile(r'nvme\d+n\d+')
+_EFI_RE = re.compile(r'Boot([0-9A-F]+)\*?\s+(.+?)\s+(HD\(.+)')
+
+@dataclass(slots=True, frozen=True)
 class Drive:
     """Represents a storage drive with all relevant information"""
     path: str
@@ -29,7 +36,7 @@ class Drive:
             return f"{self.path} ({self.size_gb}GB - {self.model})"
         return f"{self.path} ({self.size_gb}GB)"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EfiEntry:
     """Represents an EFI boot entry"""
     boot_id: str
@@ -41,7 +48,7 @@ class EfiEntry:
     def parse_from_efibootmgr(cls, line: str) -> Optional['EfiEntry']:
         """Parse EFI entry from efibootmgr output"""
         # Example: Boot0006* KDE neon      HD(1,GPT,88a04cd7-4fb4-4a9f-898b-36e3fb5534e3,0x800,0x100000)/File(\EFI\KDE Neon\shimx64.efi)
-        match = re.match(r'Boot([0-9A-F]+)\*?\s+(.+?)\s+(HD\(.+)', line)
+        match = _EFI_RE.match(line)
         if not match:
             return None
         
@@ -55,79 +62,134 @@ class HardwareDetector:
         self.dry_run = dry_run
         self.drives: List[Drive] = []
         self.efi_entries: List[EfiEntry] = []
+        self._blk_map: Dict[str, dict] = {}
+        # Contiguous has_windows flags, parallel to self.drives, so
+        # categorization filters a byte per drive instead of chasing
+        # attribute lookups
+        self._has_win_mask = bytearray()
     
+    @staticmethod
+    def _read_sysfs(path: str, limit: int = 64) -> Optional[bytes]:
+        """Read a small sysfs attribute with raw open/read/close syscalls"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return os.read(fd, limit)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    def _read_one_drive(self, drive_name: str) -> Optional[Drive]:
+        """Collect one drive's metadata; None for absent or removable drives"""
+        sys_base = f'/sys/block/{drive_name}'
+
+        if not os.path.isdir(sys_base):
+            return None
+
+        # Check if removable (exclude USB drives); if we can't read,
+        # assume it's not removable
+        raw = self._read_sysfs(f'{sys_base}/removable')
+        if raw is not None and raw.strip() == b'1':
+            return None
+
+        # Get drive size - int() accepts the raw bytes directly
+        try:
+            size_sectors = int(self._read_sysfs(f'{sys_base}/size', 32))
+            size_gb = (size_sectors * 512) // (1000 * 1000 * 1000)
+        except (TypeError, ValueError):
+            size_gb = 0
+
+        # Get drive model - truncate at the first NUL on the bytes side
+        # so only the useful prefix is decoded
+        raw = self._read_sysfs(f'{sys_base}/device/model', 128)
+        if raw is not None:
+            model = raw.split(b'\x00', 1)[0].strip().decode('ascii', 'replace')
+        else:
+            model = "Unknown"
+
+        device_path = f'/dev/{drive_name}'
+
+        # Check for Windows installation (a lookup into the lsblk snapshot)
+        has_windows = self.detect_windows(device_path)
+
+        return Drive(
+            path=device_path,
+            size_gb=size_gb,
+            model=model,
+            is_removable=False,
+            has_windows=has_windows
+        )
+
     def enumerate_nvme_drives(self) -> List[Drive]:
         """Find and validate NVMe drives - much cleaner than Bash version"""
-        drives = []
-        
-        for device_path in Path('/dev').glob('nvme*n*'):
-            if not device_path.is_block_device():
-                continue
-                
-            # Check if it matches NVMe pattern
-            if not re.match(r'/dev/nvme\d+n\d+$', str(device_path)):
-                continue
-            
-            drive_name = device_path.name
-            sys_path = Path(f'/sys/block/{drive_name}')
-            
-            if not sys_path.exists():
-                continue
-            
-            # Check if removable (exclude USB drives)
-            removable_file = sys_path / 'removable'
-            try:
-                is_removable = removable_file.read_text().strip() == '1'
-                if is_removable:
-                    continue
-            except (FileNotFoundError, PermissionError):
-                # If we can't read, assume it's not removable
-                pass
-            
-            # Get drive size
-            try:
-                size_sectors = int((sys_path / 'size').read_text().strip())
-                size_gb = (size_sectors * 512) // (1000 * 1000 * 1000)
-            except (FileNotFoundError, ValueError):
-                size_gb = 0
-            
-            # Get drive model
-            model_file = sys_path / 'device' / 'model'
-            try:
-                model = model_file.read_text().strip().replace('\x00', '')
-            except (FileNotFoundError, PermissionError):
-                model = "Unknown"
-            
-            # Check for Windows installation
-            has_windows = self.detect_windows(str(device_path))
-            
-            drive = Drive(
-                path=str(device_path),
-                size_gb=size_gb,
-                model=model,
-                is_removable=is_removable,
-                has_windows=has_windows
-            )
-            drives.append(drive)
-            
+        # One lsblk call covers Windows detection for every drive
+        self._blk_map = self._load_blk_map()
+
+        # One scandir pass over /dev; the name match already guarantees the
+        # nvmeXnY naming, so no extra stat per candidate is needed
+        with os.scandir('/dev') as entries:
+            names = sorted(e.name for e in entries
+                           if _NVME_NAME_RE.fullmatch(e.name))
+
+        # The sysfs reads are independent per drive and block in the kernel,
+        # so a small thread pool overlaps their latency
+        if names:
+            with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+                results = executor.map(self._read_one_drive, names)
+                drives = [drive for drive in results if drive is not None]
+        else:
+            drives = []
+
+        has_win_mask = bytearray(drive.has_windows for drive in drives)
+
         logger.info(f"Found {len(drives)} NVMe drives")
         self.drives = drives
+        self._has_win_mask = has_win_mask
         return drives
     
-    def detect_windows(self, drive_path: str) -> bool:
-        """Detect Windows installation on drive"""
+    def _load_blk_map(self) -> Dict[str, dict]:
+        """Map device paths to lsblk nodes with one subprocess call"""
         try:
             if self.dry_run:
-                logger.info(f"[DRY-RUN] Would check Windows on {drive_path}")
-                return False
+                logger.info("[DRY-RUN] Would enumerate block devices via lsblk")
+                return {}
             
-            # Check for Windows Boot Manager
-            result = subprocess.run(['blkid', '-o', 'value', '-s', 'LABEL', drive_path + 'p1'], 
-                                  capture_output=True, text=True)
-            return 'EFI' in result.stdout or 'SYSTEM' in result.stdout
+            result = subprocess.run(['lsblk', '-J', '-o', 'NAME,LABEL,PARTLABEL,FSTYPE'],
+                                  capture_output=True, text=True, check=True)
+            devices = json.loads(result.stdout).get('blockdevices', [])
+            return {f"/dev/{device['name']}": device for device in devices}
             
-        except (subprocess.SubprocessError, FileNotFoundError):
+        except (subprocess.SubprocessError, FileNotFoundError, json.JSONDecodeError):
+            logger.warning("lsblk not available")
+            return {}
+    
+    def detect_windows(self, drive_path: str) -> bool:
+        """Detect Windows installation on drive"""
+        if self.dry_run:
+            logger.info(f"[DRY-RUN] Would check Windows on {drive_path}")
+            return False
+
+        # Standalone callers may not have enumerated yet; take the lsblk
+        # snapshot lazily rather than silently report no Windows
+        if not self._blk_map:
+            self._blk_map = self._load_blk_map()
+
+        # Check partition labels from the single lsblk snapshot - no
+        # per-drive subprocess needed
+        device = self._blk_map.get(drive_path)
+        if not device:
             return False
+        
+        for partition in device.get('children', []):
+            for key in ('label', 'partlabel'):
+                value = partition.get(key)
+                if value and any(marker in value.upper()
+                                 for marker in ('EFI', 'SYSTEM', 'WINDOWS')):
+                    return True
+        return False
     
     def get_efi_entries(self) -> List[EfiEntry]:
         """Get EFI boot entries - much simpler than Bash parsing"""
@@ -139,11 +201,18 @@ class HardwareDetector:
             result = subprocess.run(['efibootmgr'], capture_output=True, text=True, check=True)
             entries = []
             
+            # Cheapest checks first: prefix test, then substring scan, and
+            # only run the regex on surviving candidate lines
             for line in result.stdout.splitlines():
-                if 'KDE' in line.upper():
-                    entry = EfiEntry.parse_from_efibootmgr(line)
-                    if entry:
-                        entries.append(entry)
+                if not line.startswith('Boot'):
+                    continue
+                if 'kde' not in line.casefold():
+                    continue
+                match = _EFI_RE.match(line)
+                if match:
+                    boot_id, name, device_path = match.groups()
+                    entries.append(EfiEntry(boot_id=boot_id, name=name.strip(),
+                                            device_path=device_path))
             
             self.efi_entries = entries
             return entries
@@ -154,15 +223,15 @@ class HardwareDetector:
     
     def categorize_drives(self, target_drive: str) -> Tuple[List[Drive], List[Drive]]:
         """Separate safe drives from Windows drives"""
-        safe_drives = []
-        windows_drives = []
-        
-        for drive in self.drives:
-            if drive.has_windows:
-                windows_drives.append(drive)
-            else:
-                safe_drives.append(drive)
-        
+        mask = self._has_win_mask
+        if len(mask) != len(self.drives):
+            # drives was set without re-enumerating; rebuild the mask from
+            # the attributes rather than let zip truncate and drop drives
+            mask = bytearray(d.has_windows for d in self.drives)
+            self._has_win_mask = mask
+        safe_drives = [d for d, flag in zip(self.drives, mask) if not flag]
+        windows_drives = [d for d, flag in zip(self.drives, mask) if flag]
+
         return safe_drives, windows_drives
     
     def display_drive_selection(self, available_drives: List[Drive], 